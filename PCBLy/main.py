@@ -1,70 +1,110 @@
-import math
+import re
+import numpy as np
+try:
+    from numba import njit
+except ImportError:  # numba is optional, fall back to the NumPy sweep
+    njit = None
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from tkinter import filedialog, messagebox
 import matplotlib
+matplotlib.use("TkAgg")
+matplotlib.rcParams.update({
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+    "figure.autolayout": False,
+    "text.usetex": False,
+})
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.ticker import AutoLocator, FixedLocator
 
 # --- Tooltip helper ---
 import tkinter as tk
 
-class ToolTip(object):
-    """Create a tooltip for a given widget"""
-    def __init__(self, widget, text='widget info'):
-        self.widget = widget
-        self.text = text
-        self.tipwindow = None
-        self.widget.bind("<Enter>", self.show_tip)
-        self.widget.bind("<Leave>", self.hide_tip)
+class TooltipManager(object):
+    """Share one tooltip window across all registered widgets"""
+    def __init__(self, root):
+        self.root = root
+        self.texts = {}
+        self.tip = None
+        self.label = None
+        root.bind_all("<Enter>", self.show_tip, add="+")
+        root.bind_all("<Leave>", self.hide_tip, add="+")
+
+    def register(self, widget, text='widget info'):
+        self.texts[str(widget)] = text
 
     def show_tip(self, event=None):
-        if self.tipwindow or not self.text: return
-        x, y, _, cy = self.widget.bbox("insert") if hasattr(self.widget, 'bbox') else (0,0,0,0)
-        x = x + self.widget.winfo_rootx() + 20
-        y = y + self.widget.winfo_rooty() + cy + 28
-        self.tipwindow = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(tw, text=self.text, background="#22272e", foreground="#e0f6ff",
-                         relief=tk.SOLID, borderwidth=1, font=("Segoe UI", 9))
-        label.pack(ipadx=7, ipady=3)
+        text = self.texts.get(str(event.widget))
+        if not text: return
+        widget = event.widget
+        if self.tip is None:
+            self.tip = tk.Toplevel(self.root)
+            self.tip.withdraw()
+            self.tip.wm_overrideredirect(True)
+            self.label = tk.Label(self.tip, background="#22272e", foreground="#e0f6ff",
+                                  relief=tk.SOLID, borderwidth=1, font=("Segoe UI", 9))
+            self.label.pack(ipadx=7, ipady=3)
+        x = widget.winfo_rootx() + 20
+        y = widget.winfo_rooty() + widget.winfo_height() + 4
+        self.label.config(text=text)
+        self.tip.wm_geometry(f"+{x}+{y}")
+        self.tip.deiconify()
+        self.tip.lift()
 
     def hide_tip(self, event=None):
-        tw = self.tipwindow
-        self.tipwindow = None
-        if tw: tw.destroy()
+        if self.tip is not None:
+            self.tip.withdraw()
 
 # --- Engineering Model ---
+DIAMETERS = np.array([0.2, 0.25, 0.3, 0.4, 0.5, 0.6, 0.8])
+
+# IPC-2221B clearance: (voltage thresholds, clearance mm, mm/V slope above 500V)
+_CLR_THRESHOLDS = np.array([15, 30, 50, 100, 150, 250, 500])
+_CLR_TABLES = {
+    "internal":          (_CLR_THRESHOLDS, np.array([0.05, 0.05, 0.1, 0.1, 0.2, 0.2, 0.25]), 0.0005),
+    "external_uncoated": (_CLR_THRESHOLDS, np.array([0.1, 0.1, 0.6, 0.6, 0.6, 1.25, 2.5]), 0.005),
+    "external_coated":   (_CLR_THRESHOLDS, np.array([0.05, 0.05, 0.13, 0.13, 0.4, 0.4, 0.8]), 0.00305),
+}
+
+# Hammerstad/Jensen microstrip Z0, the single copy of the formula. Works on
+# scalars and arrays, and compiles under numba for the width sweep
+def _z0_microstrip(w, h, t, er):
+    weff = w + t / np.pi * np.log(1 + 4 * np.e / (t / h + (1 / np.pi)))
+    eps_eff = (er + 1)/2 + (er - 1)/2 * (1 / np.sqrt(1 + 12 * h / w))
+    return (60 / np.sqrt(eps_eff)) * np.log(8 * h / (weff + t))
+
 class PCBModel:
     @staticmethod
     def ipc2152_trace_width(current, copper_um, temp_rise, is_ext):
         K = 0.024 if is_ext else 0.012
-        area_mm2 = K * (current ** 0.44) * (temp_rise ** -0.725)
+        area_mm2 = K * np.power(current, 0.44) * np.power(temp_rise, -0.725)
         return area_mm2 / (copper_um / 1000)
 
     @staticmethod
     def via_recommend(current, pcb_thick, plating_um, temp_rise, n_vias=1):
-        diameters = [0.2, 0.25, 0.3, 0.4, 0.5, 0.6, 0.8]
-        rec = []
-        for d in diameters:
-            t_mm = plating_um / 1000.0
-            out_d = d + 2 * t_mm
-            area_mm2 = math.pi * ((out_d/2)**2 - (d/2)**2)
-            resistance = 1.68e-8 * (pcb_thick / 1000) / (area_mm2 * 1e-6)
-            ampacity = math.sqrt(temp_rise / (resistance * 0.024))
-            total_cap = ampacity * n_vias
-            ar = pcb_thick / d
-            pad = d + 0.4
-            ok = (total_cap >= current and ar <= 10)
-            rec.append((f"{d:.2f}", f"{pad:.2f}", f"{ampacity:.2f}", f"{ar:.1f}", "✔" if ok else ""))
-        return rec
+        t_mm = plating_um / 1000.0
+        out_d = DIAMETERS + 2 * t_mm
+        area_mm2 = np.pi * ((out_d/2)**2 - (DIAMETERS/2)**2)
+        resistance = 1.68e-8 * (pcb_thick / 1000) / (area_mm2 * 1e-6)
+        ampacity = np.sqrt(temp_rise / (resistance * 0.024))
+        total_cap = ampacity * n_vias
+        ar = pcb_thick / DIAMETERS
+        pad = DIAMETERS + 0.4
+        ok = (total_cap >= current) & (ar <= 10)
+        rec = [(f"{d:.2f}", f"{p:.2f}", f"{a:.2f}", f"{r:.1f}", "✔" if k else "")
+               for d, p, a, r, k in zip(DIAMETERS, pad, ampacity, ar, ok)]
+        return rec, total_cap
 
     @staticmethod
     def impedance_microstrip(w, h, t, er):
-        weff = w + t / math.pi * math.log(1 + 4 * math.e / (t / h + (1 / math.pi)))
-        eps_eff = (er + 1)/2 + (er - 1)/2 * (1 / math.sqrt(1 + 12 * h / w))
-        return (60 / math.sqrt(eps_eff)) * math.log(8 * h / (weff + t))
+        return float(_z0_microstrip(w, h, t, er))
+
+    @staticmethod
+    def impedance_microstrip_vec(w, h, t, er):
+        return _z0_microstrip(w, h, t, er)
 
     @staticmethod
     def voltage_drop(width, copper_um, length, current):
@@ -77,29 +117,53 @@ class PCBModel:
 
     @staticmethod
     def clearance_ipc2221(voltage, loc="external_uncoated"):
-        tables = {
-            "internal":   [(15,0.05), (30,0.05), (50,0.1), (100,0.1), (150,0.2), (250,0.2), (500,0.25), (9999,lambda v:0.0005*v)],
-            "external_uncoated": [(15,0.1), (30,0.1), (50,0.6), (100,0.6), (150,0.6), (250,1.25), (500,2.5), (9999,lambda v:0.005*v)],
-            "external_coated": [(15,0.05), (30,0.05), (50,0.13), (100,0.13), (150,0.4), (250,0.4), (500,0.8), (9999,lambda v:0.00305*v)]
-        }
-        for max_v, val in tables[loc]:
-            if voltage <= max_v:
-                return val(voltage) if callable(val) else val
-        return 10.0
+        if voltage > 9999:
+            return 10.0
+        thr, vals, slope = _CLR_TABLES[loc]
+        idx = np.searchsorted(thr, voltage)
+        return slope * voltage if idx == len(thr) else float(vals[idx])
+
+TRACE_CURRENTS = np.arange(1, 26) * 0.2
+IMP_WIDTHS = np.arange(2, 41) * 0.02
+
+if njit is not None:
+    _z0_point = njit(cache=True, fastmath=True)(_z0_microstrip)
+
+    @njit(cache=True, fastmath=True)
+    def _z0_sweep(widths, h, t, er, out):
+        for i in range(widths.size):
+            out[i] = _z0_point(widths[i], h, t, er)
+        return out
+else:
+    def _z0_sweep(widths, h, t, er, out):
+        # The NumPy expression already returns a fresh array; out is only
+        # filled by the compiled loop
+        return PCBModel.impedance_microstrip_vec(widths, h, t, er)
+
+# Signed mantissa with at least one digit, optional signed exponent. A bare
+# sign or "." is also let through so the user can type the first character
+_FLOAT_RE = re.compile(r'^[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d*)?|\.)?$')
 
 def validate_float(inp):
-    try: float(inp); return True
-    except: return False
+    # Empty and partial input ("-", "1.", "1e") is allowed while typing;
+    # calc_* read values through _read_floats, which rejects them
+    return not inp or bool(_FLOAT_RE.match(inp))
 
 # --- GUI Class ---
 class PCBToolkitGUI(tb.Window):
     def __init__(self):
         super().__init__(themename="superhero")
+        self.tips = TooltipManager(self)
         self.title("PCBly")
         self.geometry("1150x700")
         self.materials = {'FR-4': 4.4, 'Rogers 4350B': 3.48, 'Polyimide': 3.5}
         self.calc_results = {}
         self.frames = {}
+        self._plots = {}
+        self._plot_bg = {}
+        self._axes_for_tab = {}
+        self._plot_xview = {}
+        self._vcmd = (self.register(validate_float), '%P')
         self.theme_mode = "superhero"
 
         topbar = tb.Frame(self, bootstyle="dark")
@@ -129,21 +193,28 @@ class PCBToolkitGUI(tb.Window):
             b = tb.Button(sidebar, text=label, width=20, bootstyle="primary-outline",
                           command=lambda i=ix: self.show_section(i))
             b.pack(pady=2, padx=0, anchor="n")
-            ToolTip(b, side_hints[ix])
+            self.tips.register(b, side_hints[ix])
             self.nav_buttons.append(b)
         self.content = tb.Frame(self, bootstyle="light")
         self.content.pack(side="left", fill="both", expand=True,padx=0,pady=0)
+        # One figure/canvas shared by all plot pages; each page owns an axes
+        # that is shown and reparented into its frame by show_section
+        self.plot_fig = Figure(figsize=(3.6,3.2), dpi=90)
+        self.plot_canvas = FigureCanvasTkAgg(self.plot_fig, master=self.content)
 
-        self.create_trace_page()
-        self.create_via_page()
-        self.create_imp_page()
-        self.create_vdrop_page()
-        self.create_clearance_page()
-        self.create_scenario_page()
+        # Pages are built on first visit by show_section
+        self._builders = {
+            "Trace Width": self.create_trace_page,
+            "Via Recommendation": self.create_via_page,
+            "Impedance": self.create_imp_page,
+            "Voltage Drop": self.create_vdrop_page,
+            "Clearance": self.create_clearance_page,
+            "Best Scenario": self.create_scenario_page,
+        }
         self.show_section(0)
         btn = tb.Button(self, text="Export Results", bootstyle="success-outline", command=self.export_results)
         btn.pack(side="bottom", pady=8)
-        ToolTip(btn, "Export all calculation results as a report file.")
+        self.tips.register(btn, "Export all calculation results as a report file.")
 
     def switch_theme(self, name):
         self.theme_mode = name
@@ -153,90 +224,194 @@ class PCBToolkitGUI(tb.Window):
         for f in self.frames.values():
             f.pack_forget()
         lbl = self.sections[idx]
+        if lbl not in self.frames:
+            self._builders[lbl]()
         f = self.frames[lbl]
         f.pack(fill="both", expand=True)
+        if lbl in self._axes_for_tab:
+            ax, host, pack_kw = self._axes_for_tab[lbl]
+            for a in self.plot_fig.axes: a.set_visible(False)
+            ax.set_visible(True)
+            widget = self.plot_canvas.get_tk_widget()
+            widget.pack(in_=host, **pack_kw)
+            # The canvas is a child of self.content, so every page frame (built
+            # lazily, hence stacked later) would hide it; raise the window on
+            # each switch. Canvas.lift is tag_raise, so call Misc.tkraise
+            tk.Misc.tkraise(widget)
+            self.plot_canvas.draw_idle()
         for b in self.nav_buttons:
             b.config(bootstyle="primary-outline")
         self.nav_buttons[idx].config(bootstyle="primary")
 
+    # -- PLOTS --
+    def _add_plot_axes(self, lbl, host, **pack_kw):
+        ax = self.plot_fig.add_subplot(111, label=lbl)
+        ax.set_visible(False)
+        self._axes_for_tab[lbl] = (ax, host, pack_kw)
+        return ax
+
+    def _register_blit(self, name, canvas, ax, artists):
+        for a in artists: a.set_animated(True)
+        self._plots[name] = (canvas, ax, artists)
+        # Fixed x view set up by the page, restored once markers are back inside it
+        self._plot_xview[name] = (ax.get_xlim(), ax.xaxis.get_major_locator())
+        canvas.mpl_connect("draw_event", lambda e: self._capture_bg(name))
+
+    def _capture_bg(self, name):
+        # Runs on every full draw (first map, resize, rescale, tab switch): grab
+        # the static background, then paint the animated artists on top of it
+        canvas, ax, artists = self._plots[name]
+        if not ax.get_visible():
+            self._plot_bg.pop(name, None)
+            return
+        self._plot_bg[name] = canvas.copy_from_bbox(ax.bbox)
+        for a in artists: ax.draw_artist(a)
+
+    def _refresh_plot(self, name, lo, hi, x=None):
+        # x keeps the page's fixed limits unless the marker position x falls
+        # outside them; y (always including 0) only rescales when the data
+        # [lo, hi] leaves the current range or fills less than half of it
+        canvas, ax, artists = self._plots[name]
+        (x0, x1), fixed = self._plot_xview[name]
+        if x is None or x0 <= x <= x1:
+            xview = (x0, x1)
+        else:
+            m = 0.05 * (x1 - x0)
+            xview = (min(x0, x - m), max(x1, x + m))
+        rescale = False
+        if tuple(ax.get_xlim()) != xview:
+            ax.set_xlim(xview)
+            ax.xaxis.set_major_locator(fixed if xview == (x0, x1) else AutoLocator())
+            rescale = True
+        ylo, yhi = min(0, lo), max(0, hi)
+        bottom, top = ax.get_ylim()
+        if ylo < bottom or yhi > top or yhi - ylo < 0.5 * (top - bottom):
+            m = 0.1 * (yhi - ylo) or 1.0
+            ax.set_ylim(ylo - m if lo < 0 else ylo, yhi + m if hi > 0 else yhi)
+            rescale = True
+        if rescale:
+            canvas.draw_idle()
+            return
+        bg = self._plot_bg.get(name)
+        if bg is None or not ax.get_visible():
+            canvas.draw_idle()
+            return
+        canvas.restore_region(bg)
+        for a in artists: ax.draw_artist(a)
+        canvas.blit(ax.bbox)
+
+    # -- INPUTS --
+    def _read_floats(self, tk_vars, quiet=False):
+        # Returns the parsed values, or None after telling the user which
+        # entry is incomplete (quiet skips the dialog, e.g. while dragging)
+        vals = []
+        for v in tk_vars:
+            try:
+                vals.append(float(v.get()))
+            except ValueError:
+                if not quiet:
+                    messagebox.showerror("Invalid input", f"'{v.get()}' is not a number.")
+                return None
+        return vals
+
+    def _make_input_frame(self, parent, schema, pady=4):
+        # schema rows: (label, unit, hint, default); returns the StringVars
+        tk_vars = []
+        for i, (lbl, unit, hint, default) in enumerate(schema):
+            v = tb.StringVar(value=default)
+            tb.Label(parent, text=f"{lbl}:", font=("Segoe UI",11)).grid(row=i,column=0,sticky="e",pady=pady)
+            e = tb.Entry(parent, textvariable=v, width=10, validate='key', validatecommand=self._vcmd)
+            e.grid(row=i,column=1,sticky="ew",padx=2)
+            tb.Label(parent, text=unit, width=6, anchor="w",font=("Segoe UI", 11), foreground="#7C7C8B"
+                     ).grid(row=i,column=2,sticky="w")
+            self.tips.register(e, hint)
+            tk_vars.append(v)
+        return tk_vars
+
     # -- TRACE --
     def create_trace_page(self):
         f = tb.Frame(self.content)
         self.frames["Trace Width"] = f
         group = tb.Labelframe(f, text="Input", bootstyle="info", padding=(12,8))
         group.pack(side="left", fill="y", pady=30, padx=30)
-        vcmd = (self.register(validate_float), '%P')
-        self.trace_vars = [tb.StringVar(value="1"), tb.StringVar(value="35"), tb.StringVar(value="20")]
-        labels = ["Current", "Copper", "Temp Rise"]
-        units = ["A", "μm", "°C"]
-        hints = ["Trace current (in Amps)", "Copper thickness in microns (35μm = 1oz)", "Temperature rise allowed above ambient."]
-        for i, (lbl, unit) in enumerate(zip(labels, units)):
-            tb.Label(group, text=f"{lbl}:", font=("Segoe UI",11)).grid(row=i,column=0,sticky="e",pady=4)
-            e = tb.Entry(group, textvariable=self.trace_vars[i], width=10, validate='key', validatecommand=vcmd)
-            e.grid(row=i,column=1,sticky="ew",padx=2)
-            tb.Label(group, text=unit, width=5, anchor="w",font=("Segoe UI", 11), foreground="#7C7C8B"
-                     ).grid(row=i,column=2,sticky="w")
-            ToolTip(e, hints[i])
+        self.trace_vars = self._make_input_frame(group, [
+            ("Current", "A", "Trace current (in Amps)", "1"),
+            ("Copper", "μm", "Copper thickness in microns (35μm = 1oz)", "35"),
+            ("Temp Rise", "°C", "Temperature rise allowed above ambient.", "20"),
+        ])
         self.trace_ext = tb.BooleanVar(value=True)
         cb = tb.Checkbutton(group,text="External",variable=self.trace_ext, bootstyle="info-round-toggle")
         cb.grid(row=3,column=0,columnspan=3,pady=7,sticky="w")
-        ToolTip(cb, "Check if trace is on PCB outer layer.")
+        self.tips.register(cb, "Check if trace is on PCB outer layer.")
+        self.trace_slider_var = tb.DoubleVar(value=1)
+        self.trace_slider = tb.Scale(group, from_=float(TRACE_CURRENTS[0]), to=float(TRACE_CURRENTS[-1]),
+                                     variable=self.trace_slider_var,
+                                     bootstyle="info", command=lambda v: self._on_trace_slider(float(v)))
+        self.trace_slider.grid(row=4,column=0,columnspan=3,sticky="ew",pady=4)
+        self.tips.register(self.trace_slider, "Drag to sweep the current and update the result live.")
         calcbtn = tb.Button(group,text="Calculate",bootstyle="success", command=self.calc_trace)
-        ToolTip(calcbtn,"Calculate safe minimum width for the entered current and copper.")
+        self.tips.register(calcbtn, "Calculate safe minimum width for the entered current and copper.")
         calcbtn.grid(row=6, column=0, columnspan=3, pady=14)
         resplot = tb.Labelframe(f, text="Result & Graph", bootstyle="info", padding=(10,8))
         resplot.pack(side="left", fill="both", expand=True, pady=30, padx=(0,30))
         self.trace_res = tb.Text(resplot, height=4, width=48, font=("Consolas", 12), state="disabled")
         self.trace_res.pack(anchor="nw", pady=2)
-        self.trace_fig = plt.Figure(figsize=(3.6,3.2), dpi=90)
-        self.trace_ax = self.trace_fig.add_subplot(111)
-        self.trace_canvas = FigureCanvasTkAgg(self.trace_fig, master=resplot)
-        self.trace_canvas.get_tk_widget().pack(anchor="nw", pady=8)
-
-    def calc_trace(self):
-        cur, cu, dT = map(float, [v.get() for v in self.trace_vars])
-        w = PCBModel.ipc2152_trace_width(cur, cu, dT, self.trace_ext.get())
-        self.trace_res.config(state="normal"); self.trace_res.delete("1.0","end")
-        self.trace_res.insert("end",f"Required width: {w:.3f} mm (IPC-2152)\n")
-        self.trace_res.config(state="disabled")
-        self.trace_ax.clear()
-        I = [i * 0.2 for i in range(1, 26)]
-        W = [PCBModel.ipc2152_trace_width(i, cu, dT, self.trace_ext.get()) for i in I]
-        self.trace_ax.plot(I, W, 'o-', color="#18c3d8", linewidth=2)
+        self.trace_ax = self._add_plot_axes("Trace Width", resplot, anchor="nw", pady=8)
+        self.trace_line, = self.trace_ax.plot([], [], 'o-', color="#18c3d8", linewidth=2)
+        self.trace_marker, = self.trace_ax.plot([], [], 'o', color="#FF6C26", markersize=8)
         self.trace_ax.set_xlabel("Current (A)")
         self.trace_ax.set_ylabel("Width (mm)")
         self.trace_ax.set_title("Trace Width vs Current (IPC-2152)", fontsize=11)
         self.trace_ax.grid(True)
-        self.trace_canvas.draw()
+        self.trace_ax.set_xlim(0, 5.2)
+        self.trace_ax.set_ylim(0, 1.1 * PCBModel.ipc2152_trace_width(TRACE_CURRENTS[-1], 35, 20, True))
+        self.trace_ax.xaxis.set_major_locator(FixedLocator([0, 1, 2, 3, 4, 5]))
+        self._register_blit("trace", self.plot_canvas, self.trace_ax, [self.trace_line, self.trace_marker])
+
+    def calc_trace(self, quiet=False):
+        vals = self._read_floats(self.trace_vars, quiet)
+        if vals is None: return
+        cur, cu, dT = vals
+        with np.errstate(all="ignore"):
+            w = PCBModel.ipc2152_trace_width(cur, cu, dT, self.trace_ext.get())
+            W = PCBModel.ipc2152_trace_width(TRACE_CURRENTS, cu, dT, self.trace_ext.get())
+        # Zero/negative copper or temperature rise gives inf/nan widths, which
+        # must not reach the axes limits
+        if not (np.isfinite(w) and w > 0 and np.all(np.isfinite(W)) and np.all(W > 0)):
+            if not quiet:
+                messagebox.showerror("Invalid input", "Current, copper and temperature rise must be positive.")
+            return
+        self.trace_res.config(state="normal"); self.trace_res.delete("1.0","end")
+        self.trace_res.insert("end",f"Required width: {w:.3f} mm (IPC-2152)\n")
+        self.trace_res.config(state="disabled")
+        self._last_trace_w = w
+        self.trace_line.set_data(TRACE_CURRENTS, W)
+        # Keep the slider on the typed current; setting its variable does not
+        # fire the slider command
+        self.trace_slider_var.set(min(max(cur, TRACE_CURRENTS[0]), TRACE_CURRENTS[-1]))
+        self.trace_marker.set_data([cur], [w])
+        self._refresh_plot("trace", 0, max(W[-1], w), x=cur)
         self.calc_results['trace'] = self.trace_res
         self.update_recommendation()
 
+    def _on_trace_slider(self, cur):
+        self.trace_vars[0].set(f"{cur:.2f}")
+        self.calc_trace(quiet=True)
+
     def create_via_page(self):
         f = tb.Frame(self.content)
         self.frames["Via Recommendation"] = f
         group = tb.Labelframe(f, text="Input", bootstyle="info", padding=(12,8))
         group.pack(side="left", fill="y", pady=30, padx=30)
-        vcmd = (self.register(validate_float), '%P')
-        self.via_vars = [tb.StringVar(value="1"), tb.StringVar(value="1.6"), tb.StringVar(value="25"),
-                         tb.StringVar(value="20"), tb.StringVar(value="1")]
-        labels = ["Via Current", "PCB Thickness", "Plating", "Temp Rise", "Parallel Vias"]
-        units = ["A", "mm", "μm", "°C", ""]
-        hints = [
-            "Current to handle per via.",
-            "Thickness of the PCB.",
-            "Electroplated copper thickness in via barrel.",
-            "Maximum allowed temperature rise.",
-            "How many vias used in parallel."
-        ]
-        for i, (lbl, unit) in enumerate(zip(labels, units)):
-            tb.Label(group, text=f"{lbl}:", font=("Segoe UI",11)).grid(row=i,column=0,sticky="e",pady=4)
-            e = tb.Entry(group, textvariable=self.via_vars[i], width=10, validate='key', validatecommand=vcmd)
-            e.grid(row=i,column=1,sticky="ew",padx=2)
-            tb.Label(group, text=unit, width=6, anchor="w",font=("Segoe UI", 11), foreground="#7C7C8B"
-                ).grid(row=i,column=2,sticky="w")
-            ToolTip(e, hints[i])
+        self.via_vars = self._make_input_frame(group, [
+            ("Via Current", "A", "Current to handle per via.", "1"),
+            ("PCB Thickness", "mm", "Thickness of the PCB.", "1.6"),
+            ("Plating", "μm", "Electroplated copper thickness in via barrel.", "25"),
+            ("Temp Rise", "°C", "Maximum allowed temperature rise.", "20"),
+            ("Parallel Vias", "", "How many vias used in parallel.", "1"),
+        ])
         calcbtn = tb.Button(group, text="Calculate", bootstyle="success", command=self.calc_via)
-        ToolTip(calcbtn, "Calculate all via options for these constraints.")
+        self.tips.register(calcbtn, "Calculate all via options for these constraints.")
         calcbtn.grid(row=6, column=0, columnspan=3, pady=10)
         resplot = tb.Labelframe(f, text="Recommendation & Plot", bootstyle="info", padding=(8,8))
         resplot.pack(side="left", fill="both", expand=True, pady=30, padx=(0,30))
@@ -244,36 +419,31 @@ class PCBToolkitGUI(tb.Window):
         for col in ("Dia","Pad","Cap","AR","✔"):
             self.via_table.heading(col, text=col)
             self.via_table.column(col, width=78 if col!="✔" else 35, anchor="center")
+        self._via_iids = [self.via_table.insert("", "end") for _ in DIAMETERS]
         self.via_table.pack(padx=5, pady=2)
-        self.via_fig = plt.Figure(figsize=(3.6,3.2), dpi=90)
-        self.via_ax = self.via_fig.add_subplot(111)
-        self.via_canvas = FigureCanvasTkAgg(self.via_fig, master=resplot)
-        self.via_canvas.get_tk_widget().pack(anchor="nw", pady=7)
-        
-    def calc_via(self):
-        vals = [float(v.get()) for v in self.via_vars]
-        table = PCBModel.via_recommend(*vals)
-        for r in self.via_table.get_children(): self.via_table.delete(r)
-        for row in table: self.via_table.insert("", "end", values=row)
-        self.via_ax.clear()
-        diameters = [0.2, 0.25, 0.3, 0.4, 0.5, 0.6, 0.8]
-        n_vias = vals[4]
-        amps = []
-        for d in diameters:
-            t_mm = vals[2] / 1000.0
-            out_d = d + 2 * t_mm
-            area_mm2 = math.pi * ((out_d/2)**2 - (d/2)**2)
-            resistance = 1.68e-8 * (vals[1] / 1000) / (area_mm2 * 1e-6)
-            ampacity = math.sqrt(vals[3] / (resistance * 0.024))
-            amps.append(ampacity * n_vias)
-        self.via_ax.plot(diameters, amps, 'o-', color="#34fa62", linewidth=2)
-        self.via_ax.axhline(vals[0], color="#fc686c", linestyle="--", label="Required")
+        self.via_ax = self._add_plot_axes("Via Recommendation", resplot, anchor="nw", pady=7)
+        self.via_line, = self.via_ax.plot([], [], 'o-', color="#34fa62", linewidth=2)
+        self.via_hline = self.via_ax.axhline(0, color="#fc686c", linestyle="--", label="Required", visible=False)
         self.via_ax.set_xlabel("Via Diameter (mm)")
         self.via_ax.set_ylabel("Max Current (A)")
         self.via_ax.set_title("Via Ampacity vs Diameter", fontsize=10)
         self.via_ax.grid(True)
         self.via_ax.legend()
-        self.via_canvas.draw()
+        self.via_ax.set_xlim(0.15, 0.85)
+        self.via_ax.set_ylim(0, 1.1 * PCBModel.via_recommend(1, 1.6, 25, 20)[1][-1])
+        self.via_ax.xaxis.set_major_locator(FixedLocator([0.2, 0.4, 0.6, 0.8]))
+        self._register_blit("via", self.plot_canvas, self.via_ax, [self.via_line, self.via_hline])
+        
+    def calc_via(self):
+        vals = self._read_floats(self.via_vars)
+        if vals is None: return
+        table, amps = PCBModel.via_recommend(*vals)
+        for iid, row in zip(self._via_iids, table): self.via_table.item(iid, values=row)
+        best = [row[0] for row in table if row[-1] == "✔"]
+        self._last_via_best = best[0] if best else None
+        self.via_line.set_data(DIAMETERS, amps)
+        self.via_hline.set_ydata([vals[0], vals[0]]); self.via_hline.set_visible(True)
+        self._refresh_plot("via", 0, max(amps[-1], vals[0]))
         self.calc_results["via"] = self.via_table
         self.update_recommendation()
 
@@ -282,60 +452,52 @@ class PCBToolkitGUI(tb.Window):
         self.frames["Impedance"] = f
         group = tb.Labelframe(f, text="Inputs", bootstyle="info", padding=(10,8))
         group.pack(side="left", fill="y", pady=30, padx=30)
-        vcmd = (self.register(validate_float), '%P')
-        self.imp_vars = [tb.StringVar(value="0.25"), tb.StringVar(value="0.18"), tb.StringVar(value="0.035"),
-                         tb.StringVar(value="FR-4 (4.4)")]
-        labels = ["Trace Width", "Height to Plane", "Cu Thickness", "Material"]
-        units = ["mm", "mm", "mm", ""]
-        hints = [
-            "Width of the microstrip trace.",
-            "Height from trace to reference plane below.",
-            "Copper thickness of trace.",
-            "Board dielectric material and εr value."
-        ]
-        for i, (lbl, unit) in enumerate(zip(labels[:-1], units[:-1])):
-            tb.Label(group, text=f"{lbl}:", font=("Segoe UI",11)).grid(row=i,column=0,sticky="e",pady=5)
-            e = tb.Entry(group, textvariable=self.imp_vars[i], width=10, validate='key', validatecommand=vcmd)
-            e.grid(row=i,column=1,sticky="ew",padx=2)
-            tb.Label(group, text=unit, width=5, anchor="w",font=("Segoe UI",10),foreground="#7C7C8B"
-                    ).grid(row=i,column=2,sticky="w")
-            ToolTip(e, hints[i])
+        self.imp_vars = self._make_input_frame(group, [
+            ("Trace Width", "mm", "Width of the microstrip trace.", "0.25"),
+            ("Height to Plane", "mm", "Height from trace to reference plane below.", "0.18"),
+            ("Cu Thickness", "mm", "Copper thickness of trace.", "0.035"),
+        ], pady=5)
+        self.imp_vars.append(tb.StringVar(value="FR-4 (4.4)"))
         tb.Label(group, text="Material ", font=("Segoe UI",11)).grid(row=3,column=0,sticky="e",pady=2)
-        matbox = tb.Combobox(group, textvariable=self.imp_vars[3], values=[f"{n} ({v})" for n,v in self.materials.items()],
+        self._imp_out = np.empty(IMP_WIDTHS.size)
+        self._material_er = {f"{n} ({v})": v for n,v in self.materials.items()}
+        matbox = tb.Combobox(group, textvariable=self.imp_vars[3], values=list(self._material_er),
                              state="readonly", width=16)
         matbox.set("FR-4 (4.4)"); matbox.grid(row=3,column=1,columnspan=2,sticky="ew")
-        ToolTip(matbox, hints[3])
+        self.tips.register(matbox, "Board dielectric material and εr value.")
         calcbtn = tb.Button(group,text="Calculate",bootstyle="success", command=self.calc_imp)
-        ToolTip(calcbtn, "Calculate Z0 for set geometry and board material.")
+        self.tips.register(calcbtn, "Calculate Z0 for set geometry and board material.")
         calcbtn.grid(row=4, column=0, columnspan=3, pady=12)
         result_box = tb.Text(f, height=5, width=54, font=("Consolas", 12), state="disabled")
         result_box.pack(side="top", padx=12, pady=12, anchor="w")
         self.imp_res = result_box
 
-        self.imp_fig = plt.Figure(figsize=(3.8,3.2), dpi=90)
-        self.imp_ax = self.imp_fig.add_subplot(111)
-        self.imp_canvas = FigureCanvasTkAgg(self.imp_fig, master=f)
-        self.imp_canvas.get_tk_widget().pack(anchor="nw", pady=6)
+        self.imp_ax = self._add_plot_axes("Impedance", f, anchor="nw", pady=6)
+        self.imp_line, = self.imp_ax.plot([], [], '-', lw=2,color="#0984FF")
+        self.imp_vline = self.imp_ax.axvline(0, color="#FF6C26", ls="--",label="Current Width", visible=False)
+        self.imp_ax.set_xlabel("Width (mm)"); self.imp_ax.set_ylabel("Z0 (Ω)")
+        self.imp_ax.set_title("Microstrip Impedance vs Width", fontsize=10)
+        self.imp_ax.grid(True); self.imp_ax.legend()
+        self.imp_ax.set_xlim(0, 0.82)
+        self.imp_ax.set_ylim(0, 1.1 * PCBModel.impedance_microstrip(IMP_WIDTHS[0], 0.18, 0.035, 4.4))
+        self.imp_ax.xaxis.set_major_locator(FixedLocator([0, 0.2, 0.4, 0.6, 0.8]))
+        self._register_blit("imp", self.plot_canvas, self.imp_ax, [self.imp_line, self.imp_vline])
         
     def calc_imp(self):
-        w = float(self.imp_vars[0].get())
-        h = float(self.imp_vars[1].get())
-        t = float(self.imp_vars[2].get())
-        er = float(self.imp_vars[3].get().split("(")[1].split(")")[0])
+        vals = self._read_floats(self.imp_vars[:3])
+        if vals is None: return
+        w, h, t = vals
+        er = self._material_er[self.imp_vars[3].get()]
         z0 = PCBModel.impedance_microstrip(w, h, t, er)
         self.imp_res.config(state='normal')
         self.imp_res.delete("1.0","end")
         self.imp_res.insert("end", f"Impedance: {z0:.2f} Ω (Hammerstad/Jensen)\n")
         self.imp_res.config(state='disabled')
-        self.imp_ax.clear()
-        widths = [x*0.02 for x in range(2,41)]
-        Z = [PCBModel.impedance_microstrip(x, h, t, er) for x in widths]
-        self.imp_ax.plot(widths, Z, '-', lw=2,color="#0984FF")
-        self.imp_ax.axvline(w, color="#FF6C26", ls="--",label="Current Width")
-        self.imp_ax.set_xlabel("Width (mm)"); self.imp_ax.set_ylabel("Z0 (Ω)")
-        self.imp_ax.set_title("Microstrip Impedance vs Width", fontsize=10)
-        self.imp_ax.grid(True); self.imp_ax.legend()
-        self.imp_canvas.draw()
+        self._last_z0 = z0
+        Z = _z0_sweep(IMP_WIDTHS, h, t, er, self._imp_out)
+        self.imp_line.set_data(IMP_WIDTHS, Z)
+        self.imp_vline.set_xdata([w, w]); self.imp_vline.set_visible(True)
+        self._refresh_plot("imp", Z[-1], Z[0], x=w)
         self.calc_results["impedance"] = self.imp_res
         self.update_recommendation()
 
@@ -344,37 +506,29 @@ class PCBToolkitGUI(tb.Window):
         self.frames["Voltage Drop"] = f
         group = tb.Labelframe(f, text="Inputs", bootstyle="info", padding=(10,8))
         group.pack(side="left", fill="y", pady=20, padx=22)
-        vcmd = (self.register(validate_float), '%P')
-        self.vd_vars = [tb.StringVar(value="0.5"), tb.StringVar(value="50"), tb.StringVar(value="35"), tb.StringVar(value="2")]
-        labels = ["Trace Width", "Length", "Copper", "Current"]
-        units = ["mm","mm","μm","A"]
-        hints = [
-            "Trace width in mm.",
-            "Trace length in mm.",
-            "Copper thickness in μm (35μm = 1oz).",
-            "Current through the trace."
-        ]
-        for i, (lbl, unit) in enumerate(zip(labels, units)):
-            tb.Label(group, text=f"{lbl}:", font=("Segoe UI",11)).grid(row=i,column=0,sticky="e",pady=2)
-            e = tb.Entry(group, textvariable=self.vd_vars[i], width=10, validate='key', validatecommand=vcmd)
-            e.grid(row=i,column=1,sticky="ew",padx=2)
-            tb.Label(group, text=unit, width=5, anchor="w",font=("Segoe UI", 11),foreground="#7C7C8B"
-                    ).grid(row=i,column=2,sticky="w")
-            ToolTip(e, hints[i])
+        self.vd_vars = self._make_input_frame(group, [
+            ("Trace Width", "mm", "Trace width in mm.", "0.5"),
+            ("Length", "mm", "Trace length in mm.", "50"),
+            ("Copper", "μm", "Copper thickness in μm (35μm = 1oz).", "35"),
+            ("Current", "A", "Current through the trace.", "2"),
+        ], pady=2)
         calcbtn = tb.Button(group,text="Calculate",bootstyle="success", command=self.calc_vdrop)
-        ToolTip(calcbtn, "Calculate trace voltage drop and power dissipation.")
+        self.tips.register(calcbtn, "Calculate trace voltage drop and power dissipation.")
         calcbtn.grid(row=4, column=0, columnspan=3, pady=10)
         result_box = tb.Text(f, height=5, width=54, font=("Consolas", 12), state="disabled")
         result_box.pack(side="top", padx=12, pady=22)
         self.vdrop_res = result_box
 
     def calc_vdrop(self):
-        w, l, cu, i = [float(v.get()) for v in self.vd_vars]
+        vals = self._read_floats(self.vd_vars)
+        if vals is None: return
+        w, l, cu, i = vals
         r, v, p = PCBModel.voltage_drop(w, cu, l, i)
         self.vdrop_res.config(state="normal")
         self.vdrop_res.delete("1.0","end")
         self.vdrop_res.insert("end", f"Resistance: {r:.5f} Ω\nVoltage drop: {v:.4f} V\nPower loss: {p*1000:.2f} mW\n")
         self.vdrop_res.config(state="disabled")
+        self._last_vdrop = v
         self.calc_results["vdrop"] = self.vdrop_res
         self.update_recommendation()
 
@@ -383,28 +537,29 @@ class PCBToolkitGUI(tb.Window):
         self.frames["Clearance"] = f
         group = tb.Labelframe(f, text="Parameters", bootstyle="info", padding=(10,8))
         group.pack(side="left", fill="y", padx=20, pady=28)
-        vcmd = (self.register(validate_float), '%P')
         self.clr_var1 = tb.StringVar(value="60")
         tb.Label(group, text="Voltage (V):", font=("Segoe UI", 11)).grid(row=0,column=0,sticky="e",pady=3)
-        ent = tb.Entry(group, textvariable=self.clr_var1, width=12, validate='key', validatecommand=vcmd)
+        ent = tb.Entry(group, textvariable=self.clr_var1, width=12, validate='key', validatecommand=self._vcmd)
         ent.grid(row=0,column=1,padx=3)
-        ToolTip(ent, "Enter maximum voltage between conductors.")
+        self.tips.register(ent, "Enter maximum voltage between conductors.")
         tb.Label(group, text="Location:", font=("Segoe UI", 11)).grid(row=1,column=0,sticky="e",pady=3)
         self.clr_loc = tb.StringVar(value="external_uncoated")
         opts=[("Internal","internal"),("External Uncoated","external_uncoated"),("External Coated","external_coated")]
         comb = tb.Combobox(group, textvariable=self.clr_loc, values=[o[0] for o in opts], state="readonly", width=19)
         comb.grid(row=1,column=1,padx=3)
-        ToolTip(comb, "Where on the board is the clearance measured?")
+        self.tips.register(comb, "Where on the board is the clearance measured?")
         calcbox = tb.Labelframe(f, text="Clearance Result", bootstyle="info", padding=(10,8))
         calcbox.pack(side="left", fill="both",expand=True,padx=(8,0),pady=28)
         self.clr_result = tb.Text(calcbox, height=4, width=54, font=("Consolas", 12),state='disabled')
         self.clr_result.pack(side="left",anchor="n")
         calc_btn = tb.Button(group, text="Calculate", bootstyle="success", width=14, command=self.calc_clearance)
         calc_btn.grid(row=2,column=0,columnspan=2,pady=16)
-        ToolTip(calc_btn, "Check minimum required clearance (IPC-2221B).")
+        self.tips.register(calc_btn, "Check minimum required clearance (IPC-2221B).")
 
     def calc_clearance(self):
-        v = float(self.clr_var1.get())
+        vals = self._read_floats([self.clr_var1])
+        if vals is None: return
+        v, = vals
         locval = self.clr_loc.get()
         opts=[("Internal","internal"),("External Uncoated","external_uncoated"),("External Coated","external_coated")]
         loc = [l for n,l in opts if n==locval][0]
@@ -413,6 +568,8 @@ class PCBToolkitGUI(tb.Window):
         self.clr_result.delete("1.0","end")
         self.clr_result.insert("end", f"Minimum clearance: {val:.3f} mm (IPC-2221B)\n")
         self.clr_result.config(state="disabled")
+        self._last_clr = val
+        self._last_clr_v = v
         self.calc_results["clearance"] = self.clr_result
         self.update_recommendation()
 
@@ -423,82 +580,64 @@ class PCBToolkitGUI(tb.Window):
                  foreground="#10FFCC", background="#232B2B").pack(pady=20)
         self.recommend_box = tk.Text(f, height=14, width=105, bg="#232B2B", fg="#D0FFB4", font=("Consolas", 12))
         self.recommend_box.pack(pady=14)
+        self.update_recommendation()
 
     def update_recommendation(self):
+        if "Best Scenario" not in self.frames:
+            return
         suggestions = []
-        try:
-            val = self.trace_res.get("1.0","end").strip()
-            if val:
-                w = float(val.split(":")[1].split("mm")[0])
-                if w < 0.2:
-                    suggestions.append("⚡ Trace width is quite thin (<0.2mm). Increase copper thickness or reduce current.")
-                elif w > 2:
-                    suggestions.append("🧱 Trace width large — use pour or increase copper for compactness.")
-                else:
-                    suggestions.append("✅ Trace width is optimal for target current/thermal rise.")
-        except: pass
-        try:
-            table = self.via_table
-            rows = [table.item(i)['values'] for i in table.get_children()]
-            best = [r for r in rows if r[-1] == "✔"]
-            if best:
-                d = best[0][0]
+        if hasattr(self, '_last_trace_w'):
+            w = self._last_trace_w
+            if w < 0.2:
+                suggestions.append("⚡ Trace width is quite thin (<0.2mm). Increase copper thickness or reduce current.")
+            elif w > 2:
+                suggestions.append("🧱 Trace width large — use pour or increase copper for compactness.")
+            else:
+                suggestions.append("✅ Trace width is optimal for target current/thermal rise.")
+        if hasattr(self, '_last_via_best'):
+            d = self._last_via_best
+            if d is not None:
                 suggestions.append(f"🕳 Recommended via diameter: {d} mm (adequate current capacity).")
             else:
                 suggestions.append("❌ No via meets required ampacity — increase via count or diameter.")
-        except: pass
-        try:
-            val = self.imp_res.get("1.0","end").strip()
-            if val:
-                z = float(val.split(":")[1].split("Ω")[0])
-                if abs(z-50)<2:
-                    suggestions.append("✅ Trace impedance very close to 50Ω — ideal for most RF/high-speed signals.")
-                elif z>60:
-                    suggestions.append("⚠️  Impedance too high; reduce width or raise εr.")
-                else:
-                    suggestions.append("⚠️  Impedance low; increase width or reduce εr.")
-        except: pass
-        try:
-            val = self.vdrop_res.get("1.0","end").strip()
-            if val:
-                parts = val.split("\n")
-                vdrop = float(parts[1].split(":")[1].replace("V",""))
-                if vdrop > 0.2:
-                    suggestions.append(f"⚡ Voltage drop is noticeable ({vdrop:.3f} V) — consider shorter trace or wider width.")
-        except: pass
-        try:
-            val = self.clr_result.get("1.0","end").strip()
-            if val:
-                v = float(self.clr_var1.get())
-                c = float(val.split(":")[1].split("mm")[0])
-                if c > 3:
-                    suggestions.append(f"🛡 High-voltage (>250V): ensure creepage is also met.")
-                else:
-                    suggestions.append(f"✅ Clearance {c:.2f} mm set for {v:.0f}V per IPC-2221B.")
-        except: pass
+        if hasattr(self, '_last_z0'):
+            z = self._last_z0
+            if abs(z-50)<2:
+                suggestions.append("✅ Trace impedance very close to 50Ω — ideal for most RF/high-speed signals.")
+            elif z>60:
+                suggestions.append("⚠️  Impedance too high; reduce width or raise εr.")
+            else:
+                suggestions.append("⚠️  Impedance low; increase width or reduce εr.")
+        if hasattr(self, '_last_vdrop'):
+            vdrop = self._last_vdrop
+            if vdrop > 0.2:
+                suggestions.append(f"⚡ Voltage drop is noticeable ({vdrop:.3f} V) — consider shorter trace or wider width.")
+        if hasattr(self, '_last_clr'):
+            c, v = self._last_clr, self._last_clr_v
+            if c > 3:
+                suggestions.append(f"🛡 High-voltage (>250V): ensure creepage is also met.")
+            else:
+                suggestions.append(f"✅ Clearance {c:.2f} mm set for {v:.0f}V per IPC-2221B.")
         sstr = "\n".join(suggestions)
-        try:
-            self.recommend_box.delete("1.0","end")
-            self.recommend_box.insert("end",sstr)
-        except:
-            pass
+        self.recommend_box.delete("1.0","end")
+        self.recommend_box.insert("end",sstr)
 
     def export_results(self):
-        alltext = ""
+        parts = []
         for k, widget in self.calc_results.items():
-            alltext += f"\n{'='*40}\n--- {k.upper()} ---\n{'='*40}\n"
+            parts.append(f"\n{'='*40}\n--- {k.upper()} ---\n{'='*40}\n")
             if isinstance(widget, tb.Text) or isinstance(widget, tk.Text):
-                alltext += widget.get(1.0, "end")
+                parts.append(widget.get(1.0, "end"))
             elif isinstance(widget, tb.Treeview):
                 colnames = [widget.heading(c)['text'] for c in widget["columns"]]
-                alltext += ", ".join(colnames) + "\n"
+                parts.append(", ".join(colnames) + "\n")
                 for row in widget.get_children():
                     vals = widget.item(row)['values']
-                    alltext += ", ".join(str(v) for v in vals) + "\n"
+                    parts.append(", ".join(str(v) for v in vals) + "\n")
         file = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text file","*.txt")])
         if file:
-            with open(file, "w") as f:
-                f.write(alltext)
+            with open(file, "w", buffering=1 << 16) as f:
+                f.writelines(parts)
             messagebox.showinfo("Export", f"Results exported to:\n{file}")
 
 if __name__ == "__main__":